@@ -2,59 +2,93 @@
 HTTP Adapter - FastAPI Application
 Handles HTTP requests and responses
 """
-from fastapi import FastAPI, HTTPException, status
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import BaseModel
+from typing import Callable, List, Optional, Type
+import msgspec
 
+from app.domain.task import TaskStatus
 from app.application.services.task_service import TaskService
 from app.adapters.persistence.memory_task_repository import MemoryTaskRepository
 
 
+# Error details shared by DTOs and endpoints, built once at import
+INVALID_STATUS_DETAIL = "Status must be 'pending' or 'done'"
+TASK_NOT_FOUND_DETAIL = "Task with id '{}' not found"
+
+
 # ===== DTOs (Data Transfer Objects) =====
 # SRP: Separate HTTP concerns from domain logic
 
-class CreateTaskRequest(BaseModel):
+class CreateTaskRequest(msgspec.Struct):
     """Request model for creating a task"""
-    title: str = Field(..., min_length=1, description="Task title (required, non-empty)")
-    status: str = Field(..., description="Task status (pending or done)")
+    title: str
+    status: str
     
-    @field_validator('title')
-    @classmethod
-    def title_not_empty(cls, v: str) -> str:
-        """Validate title is not empty or whitespace"""
-        if not v or not v.strip():
+    def __post_init__(self):
+        """Validate title is not empty and status is valid"""
+        # str.strip returns the same object when there is nothing to strip
+        title = self.title.strip()
+        if not title:
             raise ValueError('Title cannot be empty or whitespace')
-        return v.strip()
-    
-    @field_validator('status')
-    @classmethod
-    def status_valid(cls, v: str) -> str:
-        """Validate status is valid"""
-        if v.lower() not in ['pending', 'done']:
-            raise ValueError("Status must be 'pending' or 'done'")
-        return v.lower()
+        self.title = title
+        
+        # Only allocate a lowercased copy when the input is not lowercase yet
+        status = self.status if self.status.islower() else self.status.lower()
+        if status not in TaskStatus.VALUES:
+            raise ValueError(INVALID_STATUS_DETAIL)
+        self.status = status
 
 
-class UpdateTaskRequest(BaseModel):
+class UpdateTaskRequest(msgspec.Struct):
     """Request model for updating a task"""
-    title: Optional[str] = Field(None, min_length=1, description="New task title (optional)")
-    status: Optional[str] = Field(None, description="New task status (optional)")
+    title: Optional[str] = None
+    status: Optional[str] = None
     
-    @field_validator('title')
-    @classmethod
-    def title_not_empty(cls, v: Optional[str]) -> Optional[str]:
-        """Validate title is not empty or whitespace if provided"""
-        if v is not None and (not v or not v.strip()):
-            raise ValueError('Title cannot be empty or whitespace')
-        return v.strip() if v else None
-    
-    @field_validator('status')
-    @classmethod
-    def status_valid(cls, v: Optional[str]) -> Optional[str]:
-        """Validate status is valid if provided"""
-        if v is not None and v.lower() not in ['pending', 'done']:
-            raise ValueError("Status must be 'pending' or 'done'")
-        return v.lower() if v else None
+    def __post_init__(self):
+        """Validate title is not empty and status is valid if provided"""
+        if self.title is not None:
+            title = self.title.strip()
+            if not title:
+                raise ValueError('Title cannot be empty or whitespace')
+            self.title = title
+        
+        if self.status is not None:
+            status = self.status if self.status.islower() else self.status.lower()
+            if status not in TaskStatus.VALUES:
+                raise ValueError(INVALID_STATUS_DETAIL)
+            self.status = status
+
+
+def json_body(model: Type[msgspec.Struct]) -> Callable:
+    """
+    Build a dependency that decodes and validates the JSON body with msgspec
+    Errors are reported as 422, like FastAPI's own body validation
+    """
+    async def decode(request: Request):
+        try:
+            return msgspec.json.decode(await request.body(), type=model)
+        except (msgspec.ValidationError, msgspec.DecodeError) as e:
+            raise RequestValidationError([{
+                "type": "value_error",
+                "loc": ("body",),
+                "msg": str(e),
+                "input": None
+            }])
+    return decode
+
+
+def request_body_schema(model: Type[msgspec.Struct]) -> dict:
+    """Describe a msgspec request body in the OpenAPI schema"""
+    _, components = msgspec.json.schema_components((model,))
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[model.__name__]}}
+        }
+    }
 
 
 class TaskResponse(BaseModel):
@@ -76,7 +110,8 @@ class HealthResponse(BaseModel):
 app = FastAPI(
     title="Task Management API",
     description="API REST para gestión de tareas - Examen Arquitectura de Software",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
 # Initialize dependencies (Dependency Injection)
@@ -85,22 +120,39 @@ task_repository = MemoryTaskRepository()
 task_service = TaskService(task_repository)
 
 
+# ===== Exception handlers =====
+
+@app.exception_handler(ValueError)
+async def value_error_handler(request: Request, exc: ValueError):
+    """
+    Map domain validation errors to 400 Bad Request
+    Registered once instead of wrapping every endpoint in try/except
+    """
+    return ORJSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)}
+    )
+
+
 # ===== Endpoints =====
+# Handlers are plain `def`: they never await, so FastAPI runs them in its
+# threadpool instead of blocking the event loop
 
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check():
+def health_check():
     """
     Health check endpoint
     Verifies the service is running
     """
-    return HealthResponse(
+    # Trusted constant data: skip pydantic validation
+    return HealthResponse.model_construct(
         status="healthy",
         message="Task Management API is running"
     )
 
 
 @app.get("/tasks", response_model=List[TaskResponse], tags=["Tasks"])
-async def get_tasks(status: Optional[str] = None):
+def get_tasks(status_filter: Optional[str] = Query(None, alias="status")):
     """
     Get all tasks or filter by status
     
@@ -110,28 +162,33 @@ async def get_tasks(status: Optional[str] = None):
     Returns:
     - List of tasks
     """
-    try:
-        if status:
-            # Validate status parameter
-            if status.lower() not in ['pending', 'done']:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Status must be 'pending' or 'done'"
-                )
-            tasks = task_service.get_tasks_by_status(status)
-        else:
-            tasks = task_service.get_all_tasks()
-        
-        return [TaskResponse(**task.to_dict()) for task in tasks]
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error retrieving tasks: {str(e)}"
-        )
+    if status_filter:
+        # Validate status parameter
+        if not status_filter.islower():
+            status_filter = status_filter.lower()
+        if status_filter not in TaskStatus.VALUES:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=INVALID_STATUS_DETAIL
+            )
+        tasks = task_service.get_tasks_by_status(status_filter)
+    else:
+        # The repository serializes the full list straight from storage
+        return Response(task_service.get_all_tasks_json(), media_type="application/json")
+    
+    # Return the response directly to skip jsonable_encoder;
+    # response_model is kept only for the OpenAPI schema
+    return ORJSONResponse([task.to_dict() for task in tasks])
 
 
-@app.post("/tasks", response_model=TaskResponse, status_code=status.HTTP_201_CREATED, tags=["Tasks"])
-async def create_task(request: CreateTaskRequest):
+@app.post(
+    "/tasks",
+    response_model=TaskResponse,
+    status_code=status.HTTP_201_CREATED,
+    tags=["Tasks"],
+    openapi_extra=request_body_schema(CreateTaskRequest)
+)
+def create_task(request: CreateTaskRequest = Depends(json_body(CreateTaskRequest))):
     """
     Create a new task
     
@@ -145,26 +202,17 @@ async def create_task(request: CreateTaskRequest):
     Errors:
     - 400: Invalid input data
     """
-    try:
-        task = task_service.create_task(
-            title=request.title,
-            status=request.status
-        )
-        return TaskResponse(**task.to_dict())
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error creating task: {str(e)}"
-        )
+    task = task_service.create_task(
+        title=request.title,
+        status=request.status
+    )
+    # Return the task's cached JSON directly: no response_model validation
+    # or jsonable_encoder pass (response_model only documents the schema)
+    return Response(task.to_json(), status_code=status.HTTP_201_CREATED, media_type="application/json")
 
 
 @app.get("/tasks/{task_id}", response_model=TaskResponse, tags=["Tasks"])
-async def get_task(task_id: str):
+def get_task(task_id: str):
     """
     Get a specific task by ID
     
@@ -181,13 +229,19 @@ async def get_task(task_id: str):
     if task is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with id '{task_id}' not found"
+            detail=TASK_NOT_FOUND_DETAIL.format(task_id)
         )
-    return TaskResponse(**task.to_dict())
+    # Serve the JSON cached on the task; no serialization on this path
+    return Response(task.to_json(), media_type="application/json")
 
 
-@app.put("/tasks/{task_id}", response_model=TaskResponse, tags=["Tasks"])
-async def update_task(task_id: str, request: UpdateTaskRequest):
+@app.put(
+    "/tasks/{task_id}",
+    response_model=TaskResponse,
+    tags=["Tasks"],
+    openapi_extra=request_body_schema(UpdateTaskRequest)
+)
+def update_task(task_id: str, request: UpdateTaskRequest = Depends(json_body(UpdateTaskRequest))):
     """
     Update an existing task
     
@@ -205,34 +259,21 @@ async def update_task(task_id: str, request: UpdateTaskRequest):
     - 400: Invalid input data
     - 404: Task not found
     """
-    try:
-        task = task_service.update_task(
-            task_id=task_id,
-            title=request.title,
-            status=request.status
-        )
-        if task is None:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Task with id '{task_id}' not found"
-            )
-        return TaskResponse(**task.to_dict())
-    except ValueError as e:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=str(e)
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
+    task = task_service.update_task(
+        task_id=task_id,
+        title=request.title,
+        status=request.status
+    )
+    if task is None:
         raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error updating task: {str(e)}"
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=TASK_NOT_FOUND_DETAIL.format(task_id)
         )
+    return Response(task.to_json(), media_type="application/json")
 
 
 @app.delete("/tasks/{task_id}", status_code=status.HTTP_204_NO_CONTENT, tags=["Tasks"])
-async def delete_task(task_id: str):
+def delete_task(task_id: str):
     """
     Delete a task by ID
     
@@ -249,7 +290,7 @@ async def delete_task(task_id: str):
     if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Task with id '{task_id}' not found"
+            detail=TASK_NOT_FOUND_DETAIL.format(task_id)
         )
     return None
 
@@ -257,7 +298,7 @@ async def delete_task(task_id: str):
 # ===== Root endpoint =====
 
 @app.get("/", tags=["Root"])
-async def root():
+def root():
     """
     Root endpoint with API information
     """
@@ -3,20 +3,51 @@ Persistence Adapter - In-Memory Task Repository
 Implements the TaskRepository interface (DIP)
 """
 from typing import List, Optional, Dict
+import threading
+import orjson
 from app.application.ports.task_repository import TaskRepository
-from app.domain.task import Task
+from app.domain.task import Task, TaskStatus
 
 
 class MemoryTaskRepository(TaskRepository):
     """
     In-memory implementation of TaskRepository
-    Uses a dictionary to store tasks by ID
-    Thread-safe for single-threaded applications
+    Stores tasks column-wise (ids, titles, statuses) in aligned lists,
+    with a position map by ID, so bulk serialization can zip the columns
+    Writes are serialized with a lock; reads that resolve a row position
+    take it too, since a concurrent delete may move rows around
     """
     
     def __init__(self):
         """Initialize the repository with an empty storage"""
-        self._tasks: Dict[str, Task] = {}
+        # Aligned columns: row i of every list describes the same task
+        self._tasks: List[Task] = []
+        self._ids: List[str] = []
+        self._titles: List[str] = []
+        self._statuses: List[str] = []
+        # Task id -> row position in the columns
+        self._pos: Dict[str, int] = {}
+        # Secondary index: status -> {task id -> task}
+        self._by_status: Dict[str, Dict[str, Task]] = {s: {} for s in TaskStatus.VALUES}
+        self._lock = threading.Lock()
+    
+    def _index(self, task: Task) -> None:
+        """Store a task in the columns and the status index (caller holds the lock)"""
+        i = self._pos.get(task.id)
+        if i is None:
+            self._pos[task.id] = len(self._tasks)
+            self._tasks.append(task)
+            self._ids.append(task.id)
+            self._titles.append(task.title)
+            self._statuses.append(task.status)
+        else:
+            previous = self._tasks[i]
+            if previous.status != task.status:
+                del self._by_status[previous.status][task.id]
+            self._tasks[i] = task
+            self._titles[i] = task.title
+            self._statuses[i] = task.status
+        self._by_status[task.status][task.id] = task
     
     def save(self, task: Task) -> Task:
         """
@@ -28,7 +59,8 @@ class MemoryTaskRepository(TaskRepository):
         Returns:
             Task: The saved task
         """
-        self._tasks[task.id] = task
+        with self._lock:
+            self._index(task)
         return task
     
     def find_all(self) -> List[Task]:
@@ -38,7 +70,7 @@ class MemoryTaskRepository(TaskRepository):
         Returns:
             List[Task]: List of all tasks
         """
-        return list(self._tasks.values())
+        return list(self._tasks)
     
     def find_by_id(self, task_id: str) -> Optional[Task]:
         """
@@ -50,7 +82,36 @@ class MemoryTaskRepository(TaskRepository):
         Returns:
             Optional[Task]: The task if found, None otherwise
         """
-        return self._tasks.get(task_id)
+        with self._lock:
+            i = self._pos.get(task_id)
+            return self._tasks[i] if i is not None else None
+    
+    def find_by_status(self, status: str) -> List[Task]:
+        """
+        Find all tasks with the given status using the status index
+        
+        Args:
+            status: The status value to filter by
+        
+        Returns:
+            List[Task]: Tasks with that status (empty if the status is unknown)
+        """
+        tasks = self._by_status.get(status)
+        return list(tasks.values()) if tasks else []
+    
+    def dump_all_json(self) -> bytes:
+        """
+        Serialize all tasks to a JSON array straight from the columns
+        
+        Returns:
+            bytes: JSON array of {id, title, status} objects
+        """
+        with self._lock:
+            rows = [
+                {"id": i, "title": t, "status": s}
+                for i, t, s in zip(self._ids, self._titles, self._statuses)
+            ]
+        return orjson.dumps(rows)
     
     def update(self, task: Task) -> Optional[Task]:
         """
@@ -62,15 +123,18 @@ class MemoryTaskRepository(TaskRepository):
         Returns:
             Optional[Task]: The updated task if found, None otherwise
         """
-        if task.id not in self._tasks:
-            return None
-        
-        self._tasks[task.id] = task
+        with self._lock:
+            if task.id not in self._pos:
+                return None
+            
+            self._index(task)
         return task
     
     def delete(self, task_id: str) -> bool:
         """
         Delete a task by its ID
+        The last row is moved into the freed slot, so deletes are O(1)
+        but do not preserve insertion order
         
         Args:
             task_id: The task ID to delete
@@ -78,13 +142,36 @@ class MemoryTaskRepository(TaskRepository):
         Returns:
             bool: True if deleted, False if not found
         """
-        if task_id in self._tasks:
-            del self._tasks[task_id]
+        with self._lock:
+            i = self._pos.pop(task_id, None)
+            if i is None:
+                return False
+            
+            task = self._tasks[i]
+            del self._by_status[task.status][task_id]
+            
+            last = len(self._tasks) - 1
+            if i != last:
+                self._tasks[i] = self._tasks[last]
+                self._ids[i] = self._ids[last]
+                self._titles[i] = self._titles[last]
+                self._statuses[i] = self._statuses[last]
+                self._pos[self._ids[i]] = i
+            self._tasks.pop()
+            self._ids.pop()
+            self._titles.pop()
+            self._statuses.pop()
             return True
-        return False
     
     def clear(self) -> None:
         """
         Clear all tasks (useful for testing)
         """
-        self._tasks.clear()
+        with self._lock:
+            self._tasks.clear()
+            self._ids.clear()
+            self._titles.clear()
+            self._statuses.clear()
+            self._pos.clear()
+            for tasks in self._by_status.values():
+                tasks.clear()
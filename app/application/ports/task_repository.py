@@ -51,6 +51,30 @@ class TaskRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def find_by_status(self, status: str) -> List[Task]:
+        """
+        Find all tasks with the given status
+        
+        Args:
+            status: The status value to filter by ('pending' or 'done')
+        
+        Returns:
+            List[Task]: Tasks with that status
+        """
+        pass
+    
+    @abstractmethod
+    def dump_all_json(self) -> bytes:
+        """
+        Serialize all tasks to a JSON array
+        Lets each implementation pick the fastest bulk serialization path
+        
+        Returns:
+            bytes: JSON array of {id, title, status} objects
+        """
+        pass
+    
     @abstractmethod
     def update(self, task: Task) -> Optional[Task]:
         """
@@ -52,6 +52,15 @@ class TaskService:
         """
         return self._repository.find_all()
     
+    def get_all_tasks_json(self) -> bytes:
+        """
+        Retrieve all tasks already serialized as a JSON array
+        
+        Returns:
+            bytes: JSON array of all tasks
+        """
+        return self._repository.dump_all_json()
+    
     def get_task_by_id(self, task_id: str) -> Optional[Task]:
         """
         Retrieve a task by its ID
@@ -86,7 +95,7 @@ class TaskService:
         
         # Prepare updated values
         new_title = title if title is not None else existing_task.title
-        new_status = status if status is not None else existing_task.status.value
+        new_status = status if status is not None else existing_task.status
         
         # Create updated task using factory
         updated_task = TaskFactory.create(
@@ -121,5 +130,4 @@ class TaskService:
         Returns:
             List[Task]: Filtered list of tasks
         """
-        all_tasks = self._repository.find_all()
-        return [task for task in all_tasks if task.status.value == status.lower()]
+        return self._repository.find_by_status(status if status.islower() else status.lower())
@@ -2,19 +2,26 @@
 Domain layer - Task Entity
 Implements SRP: Single responsibility for task business logic
 """
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
 from typing import Optional
+import sys
 import uuid
 
+import orjson
 
-class TaskStatus(Enum):
-    """Valid task statuses"""
-    PENDING = "pending"
-    DONE = "done"
+
+class TaskStatus:
+    """
+    Valid task statuses
+    Plain interned strings instead of an Enum: no EnumMeta call on creation
+    and no .value lookup when serializing
+    """
+    PENDING = sys.intern("pending")
+    DONE = sys.intern("done")
+    VALUES = frozenset((PENDING, DONE))
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Task:
     """
     Task entity - represents a task in the domain
@@ -22,24 +29,32 @@ class Task:
     """
     id: str
     title: str
-    status: TaskStatus
+    status: str
+    _json: bytes = field(default=b"", init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate task after initialization"""
         if not self.title or not self.title.strip():
             raise ValueError("Task title cannot be empty")
         
-        if not isinstance(self.status, TaskStatus):
-            raise ValueError(f"Invalid status. Must be one of: {[s.value for s in TaskStatus]}")
+        if self.status not in TaskStatus.VALUES:
+            raise ValueError(f"Invalid status. Must be one of: {[TaskStatus.PENDING, TaskStatus.DONE]}")
+        
+        # Immutable, so the JSON form can be computed once and reused
+        object.__setattr__(self, '_json', orjson.dumps(self.to_dict()))
     
     def to_dict(self) -> dict:
         """Convert task to dictionary representation"""
         return {
             "id": self.id,
             "title": self.title,
-            "status": self.status.value
+            "status": self.status
         }
     
+    def to_json(self) -> bytes:
+        """Return the JSON representation computed at creation"""
+        return self._json
+    
     def mark_as_done(self) -> 'Task':
         """Create a new task with status done (immutability)"""
         return Task(
@@ -80,14 +95,14 @@ class TaskFactory:
             ValueError: If validation fails
         """
         # Validate and convert status
-        try:
-            task_status = TaskStatus(status.lower())
-        except ValueError:
+        # Interning returns the TaskStatus constant itself for valid input
+        task_status = sys.intern(status if status.islower() else status.lower())
+        if task_status not in TaskStatus.VALUES:
             raise ValueError(f"Invalid status '{status}'. Must be 'pending' or 'done'")
         
         # Generate ID if not provided
         if task_id is None:
-            task_id = str(uuid.uuid4())
+            task_id = uuid.uuid4().hex
         
         # Create and return task (validation happens in __post_init__)
         return Task(
@@ -2,6 +2,8 @@
 Unit Tests for Task Management API
 Demonstrates testing with dependency injection and mocking
 """
+import json
+import threading
 import pytest
 from app.domain.task import Task, TaskFactory, TaskStatus
 from app.application.services.task_service import TaskService
@@ -63,6 +65,13 @@ class TestTask:
         assert task_dict["status"] == "pending"
         assert "id" in task_dict
     
+    def test_task_to_json_matches_to_dict(self):
+        """Test that the cached JSON matches the dictionary representation"""
+        task = TaskFactory.create(title="Test", status="done")
+        
+        assert json.loads(task.to_json()) == task.to_dict()
+        assert json.loads(task.mark_as_done().update_title("Renamed").to_json())["title"] == "Renamed"
+    
     def test_mark_as_done_immutability(self):
         """Test that mark_as_done creates a new task (immutability)"""
         task = TaskFactory.create(title="Test", status="pending")
@@ -74,6 +83,13 @@ class TestTask:
         assert done_task.status == TaskStatus.DONE
         # Same ID
         assert task.id == done_task.id
+    
+    def test_task_is_frozen(self):
+        """Test that task attributes cannot be reassigned"""
+        task = TaskFactory.create(title="Test", status="pending")
+        
+        with pytest.raises(AttributeError):
+            task.title = "Changed"
 
 
 # ===== Repository Tests =====
@@ -144,6 +160,62 @@ class TestMemoryTaskRepository:
         """Test deleting a task that doesn't exist"""
         deleted = self.repo.delete("nonexistent-id")
         assert deleted is False
+    
+    def test_find_by_status_tracks_updates_and_deletes(self):
+        """Test that the status index follows updates and deletes"""
+        task = TaskFactory.create(title="Indexed", status="pending")
+        other = TaskFactory.create(title="Other", status="pending")
+        self.repo.save(task)
+        self.repo.save(other)
+        
+        self.repo.update(TaskFactory.create(title="Indexed", status="done", task_id=task.id))
+        assert [t.id for t in self.repo.find_by_status("pending")] == [other.id]
+        assert [t.id for t in self.repo.find_by_status("done")] == [task.id]
+        
+        self.repo.delete(task.id)
+        assert self.repo.find_by_status("done") == []
+    
+    def test_delete_keeps_remaining_tasks_addressable(self):
+        """Test that moving the last task into a deleted slot keeps lookups valid"""
+        tasks = [TaskFactory.create(title=f"Task {n}", status="pending") for n in range(3)]
+        for task in tasks:
+            self.repo.save(task)
+        
+        self.repo.delete(tasks[0].id)
+        
+        assert self.repo.find_by_id(tasks[0].id) is None
+        assert self.repo.find_by_id(tasks[2].id) is tasks[2]
+        assert self.repo.find_by_id(tasks[1].id) is tasks[1]
+    
+    def test_dump_all_json(self):
+        """Test bulk JSON serialization of all tasks"""
+        task = TaskFactory.create(title="Test", status="done")
+        self.repo.save(task)
+        self.repo.update(TaskFactory.create(title="Renamed", status="pending", task_id=task.id))
+        
+        assert json.loads(self.repo.dump_all_json()) == [
+            {"id": task.id, "title": "Renamed", "status": "pending"}
+        ]
+    
+    def test_concurrent_writes_keep_storage_consistent(self):
+        """Test that saves and deletes from several threads leave aligned storage"""
+        def worker():
+            for n in range(200):
+                task = TaskFactory.create(title=f"Task {n}", status="pending")
+                self.repo.save(task)
+                if n % 2:
+                    self.repo.delete(task.id)
+        
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        all_tasks = self.repo.find_all()
+        assert len(all_tasks) == 400
+        assert all(self.repo.find_by_id(task.id) is task for task in all_tasks)
+        assert len(self.repo.find_by_status("pending")) == 400
 
 
 # ===== Service Tests =====